@@ -13,48 +13,79 @@ to move the sensor between dry and wet conditions.
 """
 
 import machine
-import time
+import micropython
+import sys
+import array
+import asyncio
+import framebuf
 from ssd1306 import SSD1306_I2C
-import json
+import struct
 
 # Hardware configuration
 SENSOR_PIN = 26
 I2C_SDA = 4
 I2C_SCL = 5
 I2C_FREQ = 400000
-CONFIG_FILE = 'moisture_config.json'
+CONFIG_FILE = 'moisture_config.bin'  # Binary: struct '<ff' (dry_freq, wet_freq)
 
 # Timing - adjust these if you need more/less time
 PREP_TIME = 10  # Seconds to prepare sensor between measurements
 SAMPLE_TIME = 3  # Seconds to measure frequency (for accuracy)
 
+# Calibration sanity checks: (predicate(dry, wet), fatal, console lines, display lines)
+# Console lines may use {dry} and {wet} placeholders
+CHECKS = (
+    (lambda d, w: w >= d, True, (
+        "\n⚠️  ERROR: Dry frequency should be HIGHER than wet!",
+        "    Capacitive sensors have INVERSE relationship:",
+        "    - Dry (air) = HIGH frequency",
+        "    - Wet (water) = LOW frequency",
+        "    Got: Dry={dry:.1f}Hz, Wet={wet:.1f}Hz",
+        "    Something went wrong - try again!",
+    ), ("ERROR!", "Dry <= Wet", "Try again", "")),
+    (lambda d, w: d < 15, False, (
+        "\n⚠️  WARNING: Dry frequency seems low (<15 Hz)",
+        "    Expected ~20-30 Hz for sensor in air",
+        "    Was the sensor actually in air?",
+    ), ("WARNING!", "Low dry freq", "Check setup", "")),
+    (lambda d, w: w > 10, False, (
+        "\n⚠️  WARNING: Wet frequency seems high (>10 Hz)",
+        "    Expected ~0-5 Hz for sensor in water",
+        "    Was the sensor actually submerged?",
+    ), ("WARNING!", "High wet freq", "Check setup", "")),
+)
+
+# Pulse counter shared with the interrupt handler (no allocation in the ISR)
+_PULSE = array.array('L', [0])
+
+@micropython.viper
+def _count_pulse(pin):
+    """Hard interrupt handler for counting pulses"""
+    p = ptr32(_PULSE)
+    p[0] = p[0] + 1
+
 class MoistureSensor:
     """Handles reading from Pimoroni Grow PFM moisture sensor"""
     
     def __init__(self, pin_number):
         self.pin = machine.Pin(pin_number, machine.Pin.IN, machine.Pin.PULL_DOWN)
-        self.pulse_count = 0
         self.last_frequency = 0
-        
-    def count_pulse(self, pin):
-        """Interrupt handler for counting pulses"""
-        self.pulse_count += 1
     
-    def read_frequency(self, sample_time=3):
+    async def read_frequency(self, sample_time=3):
         """Measure the pulse frequency from the sensor"""
-        self.pulse_count = 0
+        _PULSE[0] = 0
         
-        # Set up interrupt on rising edge
-        self.pin.irq(trigger=machine.Pin.IRQ_RISING, handler=self.count_pulse)
+        # Set up hard interrupt on rising edge
+        self.pin.irq(trigger=machine.Pin.IRQ_RISING, handler=_count_pulse, hard=True)
         
         # Count pulses for sample_time seconds
-        time.sleep(sample_time)
+        await asyncio.sleep(sample_time)
         
         # Disable interrupt
         self.pin.irq(handler=None)
         
         # Calculate frequency
-        frequency = self.pulse_count / sample_time
+        frequency = _PULSE[0] / sample_time
         self.last_frequency = frequency
         
         return frequency
@@ -65,6 +96,10 @@ class MoistureDisplay:
     def __init__(self, i2c):
         self.oled = SSD1306_I2C(128, 64, i2c)
         self.oled.contrast(255)
+        
+        # One-page (128x8) row buffer, sent with write_page() without a full redraw
+        self.row = bytearray(128)
+        self.row_fb = framebuf.FrameBuffer(self.row, 128, 8, framebuf.MONO_VLSB)
     
     def show_message(self, line1, line2="", line3="", line4=""):
         """Display a multi-line message"""
@@ -78,41 +113,69 @@ class MoistureDisplay:
         if line4:
             self.oled.text(line4, 0, 48, 1)
         self.oled.show()
+    
+    def write_page(self, page, buf):
+        """Send one page (8-pixel row) straight to the panel"""
+        self.oled.write_cmd(0x21)  # SET_COL_ADDR
+        self.oled.write_cmd(0)
+        self.oled.write_cmd(127)
+        self.oled.write_cmd(0x22)  # SET_PAGE_ADDR
+        self.oled.write_cmd(page)
+        self.oled.write_cmd(page)
+        self.oled.write_data(buf)
+    
+    def show_progress(self, step, page=4):
+        """Show a 1-16 dot progress ticker on one page (default: third text line)"""
+        self.row_fb.fill(0)
+        for i in range(step % 16 + 1):
+            self.row_fb.fill_rect(i * 8 + 3, 3, 2, 2, 1)
+        self.write_page(page, self.row)
+
+def emit(*lines):
+    """Write several console lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def countdown_timer(display, seconds, message):
+async def countdown_timer(display, seconds, message):
     """Show a countdown on the display"""
+    # Draw the static lines once, then only send the seconds row (page 4)
+    display.show_message(message, "", "", "Get ready!")
     for i in range(seconds, 0, -1):
-        display.show_message(
-            message,
-            "",
-            f"{i} seconds...",
-            "Get ready!"
-        )
+        display.row_fb.fill(0)
+        display.row_fb.text(f"{i} seconds...", 0, 0, 1)
+        display.write_page(4, display.row)
         print(f"{message} - {i} seconds remaining...")
-        time.sleep(1)
+        await asyncio.sleep(1)
+
+async def _refresh_display_dots(display):
+    """Animate a row of dots on the bottom line (page 6) until cancelled"""
+    step = 0
+    while True:
+        display.show_progress(step, 6)
+        step += 1
+        await asyncio.sleep_ms(250)
 
 def save_config(dry_freq, wet_freq):
     """Save calibration values to file"""
-    data = {
-        'dry_freq': dry_freq,
-        'wet_freq': wet_freq
-    }
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(data, f)
-    print(f"\nCalibration saved to {CONFIG_FILE}")
-    print(f"  Dry: {dry_freq:.2f} Hz (HIGH frequency - in air)")
-    print(f"  Wet: {wet_freq:.2f} Hz (LOW frequency - in water)")
+    with open(CONFIG_FILE, 'wb') as f:
+        f.write(struct.pack('<ff', dry_freq, wet_freq))
+    emit(
+        f"\nCalibration saved to {CONFIG_FILE}",
+        f"  Dry: {dry_freq:.2f} Hz (HIGH frequency - in air)",
+        f"  Wet: {wet_freq:.2f} Hz (LOW frequency - in water)",
+    )
 
-def main():
+async def main():
     """Manual calibration with timed intervals"""
-    print("\n" + "="*60)
-    print("MANUAL CALIBRATION - Button-less Version (FIXED)")
-    print("="*60)
-    print("\nIMPORTANT: Capacitive sensors have INVERSE frequency!")
-    print("  - Dry (air) = HIGH frequency (~20-30 Hz)")
-    print("  - Wet (water) = LOW frequency (~0-5 Hz)")
-    print(f"\nThis script will guide you through calibration with")
-    print(f"{PREP_TIME} seconds between each measurement.\n")
+    emit(
+        "\n" + "="*60,
+        "MANUAL CALIBRATION - Button-less Version (FIXED)",
+        "="*60,
+        "\nIMPORTANT: Capacitive sensors have INVERSE frequency!",
+        "  - Dry (air) = HIGH frequency (~20-30 Hz)",
+        "  - Wet (water) = LOW frequency (~0-5 Hz)",
+        f"\nThis script will guide you through calibration with",
+        f"{PREP_TIME} seconds between each measurement.\n",
+    )
     
     # Initialize hardware
     print("Initializing hardware...")
@@ -121,145 +184,143 @@ def main():
     sensor = MoistureSensor(SENSOR_PIN)
     
     display.show_message("CALIBRATION", "Starting...", "", "")
-    time.sleep(2)
+    await asyncio.sleep(2)
     
     # ========================================
     # STEP 1: DRY CALIBRATION
     # ========================================
-    print("\n" + "="*60)
-    print("STEP 1: DRY CALIBRATION (expect HIGH frequency)")
-    print("="*60)
-    print("\nINSTRUCTIONS:")
-    print("1. Remove sensor from soil completely")
-    print("2. Hold sensor in AIR (not touching anything wet)")
-    print("3. Keep sensor steady during measurement")
-    print(f"\nYou have {PREP_TIME} seconds to prepare...")
-    print("Starting countdown NOW!\n")
+    emit(
+        "\n" + "="*60,
+        "STEP 1: DRY CALIBRATION (expect HIGH frequency)",
+        "="*60,
+        "\nINSTRUCTIONS:",
+        "1. Remove sensor from soil completely",
+        "2. Hold sensor in AIR (not touching anything wet)",
+        "3. Keep sensor steady during measurement",
+        f"\nYou have {PREP_TIME} seconds to prepare...",
+        "Starting countdown NOW!\n",
+    )
     
     display.show_message("STEP 1:", "Remove sensor", "Hold in AIR", "")
     
     # Countdown to dry measurement
-    countdown_timer(display, PREP_TIME, "DRY - Hold in air")
+    await countdown_timer(display, PREP_TIME, "DRY - Hold in air")
     
     # Take dry measurement
     display.show_message("Measuring...", "DRY reading", "Hold still!", "")
-    print("\nMeasuring DRY frequency...")
-    print("(Hold sensor steady in air)")
+    emit(
+        "\nMeasuring DRY frequency...",
+        "(Hold sensor steady in air)",
+    )
     
-    dry_freq = sensor.read_frequency(SAMPLE_TIME)
+    dots = asyncio.create_task(_refresh_display_dots(display))
+    dry_freq = await sensor.read_frequency(SAMPLE_TIME)
+    dots.cancel()
     
     print(f"\n✓ DRY frequency measured: {dry_freq:.2f} Hz")
     
     display.show_message("DRY Reading:", f"{dry_freq:.1f} Hz", "(HIGH freq)", "Step 1 done!")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     # ========================================
     # STEP 2: WET CALIBRATION
     # ========================================
-    print("\n" + "="*60)
-    print("STEP 2: WET CALIBRATION (expect LOW frequency)")
-    print("="*60)
-    print("\nINSTRUCTIONS:")
-    print("1. Place sensor in a glass/cup of water, OR")
-    print("2. Push sensor into VERY wet/saturated soil")
-    print("3. Make sure sensor is fully submerged/surrounded")
-    print(f"\nYou have {PREP_TIME} seconds to prepare...")
-    print("Starting countdown NOW!\n")
+    emit(
+        "\n" + "="*60,
+        "STEP 2: WET CALIBRATION (expect LOW frequency)",
+        "="*60,
+        "\nINSTRUCTIONS:",
+        "1. Place sensor in a glass/cup of water, OR",
+        "2. Push sensor into VERY wet/saturated soil",
+        "3. Make sure sensor is fully submerged/surrounded",
+        f"\nYou have {PREP_TIME} seconds to prepare...",
+        "Starting countdown NOW!\n",
+    )
     
     display.show_message("STEP 2:", "Put sensor", "in WATER", "")
     
     # Countdown to wet measurement
-    countdown_timer(display, PREP_TIME, "WET - Put in water")
+    await countdown_timer(display, PREP_TIME, "WET - Put in water")
     
     # Take wet measurement
     display.show_message("Measuring...", "WET reading", "Hold still!", "")
-    print("\nMeasuring WET frequency...")
-    print("(Sensor should be in water/very wet soil)")
+    emit(
+        "\nMeasuring WET frequency...",
+        "(Sensor should be in water/very wet soil)",
+    )
     
-    wet_freq = sensor.read_frequency(SAMPLE_TIME)
+    dots = asyncio.create_task(_refresh_display_dots(display))
+    wet_freq = await sensor.read_frequency(SAMPLE_TIME)
+    dots.cancel()
     
     print(f"\n✓ WET frequency measured: {wet_freq:.2f} Hz")
     
     display.show_message("WET Reading:", f"{wet_freq:.1f} Hz", "(LOW freq)", "Step 2 done!")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     # ========================================
     # VALIDATION & SAVE
     # ========================================
-    print("\n" + "="*60)
-    print("CALIBRATION RESULTS")
-    print("="*60)
-    print(f"\nDry frequency:  {dry_freq:.2f} Hz (should be HIGH)")
-    print(f"Wet frequency:  {wet_freq:.2f} Hz (should be LOW)")
-    print(f"Difference:     {dry_freq - wet_freq:.2f} Hz")
+    emit(
+        "\n" + "="*60,
+        "CALIBRATION RESULTS",
+        "="*60,
+        f"\nDry frequency:  {dry_freq:.2f} Hz (should be HIGH)",
+        f"Wet frequency:  {wet_freq:.2f} Hz (should be LOW)",
+        f"Difference:     {dry_freq - wet_freq:.2f} Hz",
+    )
     
     # Validate results - DRY should be HIGHER than WET!
-    if wet_freq >= dry_freq:
-        print("\n⚠️  ERROR: Dry frequency should be HIGHER than wet!")
-        print("    Capacitive sensors have INVERSE relationship:")
-        print("    - Dry (air) = HIGH frequency")
-        print("    - Wet (water) = LOW frequency")
-        print(f"    Got: Dry={dry_freq:.1f}Hz, Wet={wet_freq:.1f}Hz")
-        print("    Something went wrong - try again!")
-        display.show_message("ERROR!", "Dry <= Wet", "Try again", "")
-        time.sleep(5)
-        return
-    
-    if dry_freq < 15:
-        print("\n⚠️  WARNING: Dry frequency seems low (<15 Hz)")
-        print("    Expected ~20-30 Hz for sensor in air")
-        print("    Was the sensor actually in air?")
-        display.show_message("WARNING!", "Low dry freq", "Check setup", "")
-        time.sleep(5)
-    
-    if wet_freq > 10:
-        print("\n⚠️  WARNING: Wet frequency seems high (>10 Hz)")
-        print("    Expected ~0-5 Hz for sensor in water")
-        print("    Was the sensor actually submerged?")
-        display.show_message("WARNING!", "High wet freq", "Check setup", "")
-        time.sleep(5)
+    for check, fatal, lines, message in CHECKS:
+        if check(dry_freq, wet_freq):
+            emit(*(line.format(dry=dry_freq, wet=wet_freq) for line in lines))
+            display.show_message(*message)
+            await asyncio.sleep(5)
+            if fatal:
+                return
     
     # Save configuration
     print("\nSaving calibration...")
     save_config(dry_freq, wet_freq)
     
     display.show_message("Calibration", "COMPLETE!", "", "Saved!")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     # ========================================
     # FINAL SUMMARY
     # ========================================
-    print("\n" + "="*60)
-    print("✓ CALIBRATION COMPLETE!")
-    print("="*60)
-    print(f"\nYour calibration values:")
-    print(f"  Dry: {dry_freq:.2f} Hz  (HIGH - sensor in air)")
-    print(f"  Wet: {wet_freq:.2f} Hz  (LOW - sensor in water)")
-    print(f"  Range: {dry_freq - wet_freq:.2f} Hz")
-    print(f"\nThese values are saved to: {CONFIG_FILE}")
-    print("\nHow the sensor works:")
-    print("  - More moisture = Lower frequency")
-    print("  - Less moisture = Higher frequency")
-    print("  - This is INVERSE relationship (capacitance-based)")
-    print("\nExpected moisture readings:")
-    print(f"  Air/Very dry:     ~{dry_freq:.0f}Hz = 0-10%")
-    print(f"  Dry soil:         ~{(dry_freq+wet_freq)/2:.0f}Hz = 30-50%")
-    print(f"  Moist soil:       ~{(wet_freq + (dry_freq-wet_freq)*0.3):.0f}Hz = 60-80%")
-    print(f"  Wet/Saturated:    ~{wet_freq:.0f}Hz = 90-100%")
-    print("\nYou can now run the main monitoring program!")
-    print("="*60 + "\n")
+    emit(
+        "\n" + "="*60,
+        "✓ CALIBRATION COMPLETE!",
+        "="*60,
+        f"\nYour calibration values:",
+        f"  Dry: {dry_freq:.2f} Hz  (HIGH - sensor in air)",
+        f"  Wet: {wet_freq:.2f} Hz  (LOW - sensor in water)",
+        f"  Range: {dry_freq - wet_freq:.2f} Hz",
+        f"\nThese values are saved to: {CONFIG_FILE}",
+        "\nHow the sensor works:",
+        "  - More moisture = Lower frequency",
+        "  - Less moisture = Higher frequency",
+        "  - This is INVERSE relationship (capacitance-based)",
+        "\nExpected moisture readings:",
+        f"  Air/Very dry:     ~{dry_freq:.0f}Hz = 0-10%",
+        f"  Dry soil:         ~{(dry_freq+wet_freq)/2:.0f}Hz = 30-50%",
+        f"  Moist soil:       ~{(wet_freq + (dry_freq-wet_freq)*0.3):.0f}Hz = 60-80%",
+        f"  Wet/Saturated:    ~{wet_freq:.0f}Hz = 90-100%",
+        "\nYou can now run the main monitoring program!",
+        "="*60 + "\n",
+    )
     
     display.show_message("Ready to", "monitor!", "", "Run main.py")
-    time.sleep(3)
+    await asyncio.sleep(3)
     display.oled.fill(0)
     display.oled.show()
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\nCalibration cancelled by user")
     except Exception as e:
         print(f"\n\nError during calibration: {e}")
-        import sys
         sys.print_exception(e)
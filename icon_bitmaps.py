@@ -8,6 +8,9 @@ Icons:
 - DROP_HALF: Half-filled drop (34-66% moisture)
 - DROP_FULL: Fully filled drop (67-100% moisture)
 
+All three icons share one contiguous 384-byte buffer (DROP_ICONS);
+DROP_EMPTY/HALF/FULL are 128-byte memoryview slices of it.
+
 Usage:
     from icon_bitmaps import DROP_EMPTY, DROP_HALF, DROP_FULL
     import framebuf
@@ -19,8 +22,8 @@ Usage:
     oled.blit(fbuf, x, y)
 """
 
-# Empty drop with slash (0-33% moisture)
-DROP_EMPTY = bytearray([
+DROP_ICONS = bytearray([
+    # Empty drop with slash (0-33% moisture)
     0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x00, 
     0x00, 0x03, 0xc0, 0x00, 0x00, 0x07, 0xe0, 0x00, 
     0x06, 0x0e, 0x70, 0x00, 0x07, 0x18, 0x18, 0x00, 
@@ -36,14 +39,8 @@ DROP_EMPTY = bytearray([
     0x01, 0xc0, 0x03, 0x80, 0x00, 0xe0, 0x07, 0xc0, 
     0x00, 0x7c, 0x1e, 0xe0, 0x00, 0x1f, 0xf8, 0x60, 
     0x00, 0x0f, 0xe0, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-])
-
-DROP_EMPTY_WIDTH = 32
-DROP_EMPTY_HEIGHT = 32
-
-# Half-filled drop (34-66% moisture)
-DROP_HALF = bytearray([
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    # Half-filled drop (34-66% moisture)
     0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x00, 
     0x00, 0x03, 0xc0, 0x00, 0x00, 0x07, 0xe0, 0x00, 
     0x00, 0x0d, 0xb0, 0x00, 0x00, 0x19, 0x98, 0x00, 
@@ -59,14 +56,8 @@ DROP_HALF = bytearray([
     0x01, 0xc1, 0xff, 0x80, 0x00, 0xe1, 0x87, 0x00, 
     0x00, 0x79, 0x9e, 0x00, 0x00, 0x3f, 0xfc, 0x00, 
     0x00, 0x07, 0xe0, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-])
-
-DROP_HALF_WIDTH = 32
-DROP_HALF_HEIGHT = 32
-
-# Fully filled drop (67-100% moisture)
-DROP_FULL = bytearray([
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    # Fully filled drop (67-100% moisture)
     0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x00, 
     0x00, 0x03, 0xc0, 0x00, 0x00, 0x07, 0xe0, 0x00, 
     0x00, 0x0e, 0x70, 0x00, 0x00, 0x18, 0x18, 0x00, 
@@ -85,5 +76,22 @@ DROP_FULL = bytearray([
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
 ])
 
+_ICONS = memoryview(DROP_ICONS)
+
+# Empty drop with slash (0-33% moisture)
+DROP_EMPTY = _ICONS[0:128]
+
+DROP_EMPTY_WIDTH = 32
+DROP_EMPTY_HEIGHT = 32
+
+# Half-filled drop (34-66% moisture)
+DROP_HALF = _ICONS[128:256]
+
+DROP_HALF_WIDTH = 32
+DROP_HALF_HEIGHT = 32
+
+# Fully filled drop (67-100% moisture)
+DROP_FULL = _ICONS[256:384]
+
 DROP_FULL_WIDTH = 32
 DROP_FULL_HEIGHT = 32
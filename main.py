@@ -19,11 +19,13 @@ IMPORTANT: Capacitive moisture sensors have INVERSE frequency relationship:
 """
 
 import machine
+import rp2
 import time
 import framebuf
 from ssd1306 import SSD1306_I2C
 from icon_bitmaps import DROP_EMPTY, DROP_HALF, DROP_FULL
 import json
+import struct
 import network
 import ntptime
 
@@ -38,9 +40,11 @@ DISPLAY_HEIGHT = 64
 # Timing configuration
 MEASUREMENT_INTERVAL = 60  # seconds between readings
 FREQUENCY_SAMPLE_TIME = 2  # seconds to measure pulse frequency
+PROGRESS_INTERVAL_MS = 250  # minimum ms between WiFi progress ticker redraws
 
 # Configuration files
-CONFIG_FILE = 'moisture_config.json'
+CONFIG_FILE = 'moisture_config.bin'  # Binary: struct '<ff' (dry_freq, wet_freq)
+LEGACY_CONFIG_FILE = 'moisture_config.json'  # Older JSON format, migrated on load
 WIFI_CONFIG_FILE = 'wifi_config.json'
 
 # Timezone offset for UK (GMT/BST)
@@ -48,6 +52,31 @@ WIFI_CONFIG_FILE = 'wifi_config.json'
 # MicroPython doesn't auto-detect DST, so you may need to adjust this
 TIMEZONE_OFFSET = 0  # Hours offset from UTC
 
+# Log line formats for the monitoring loop
+_FMT_READING = "[%s] Taking reading..."
+_FMT_FREQ = "Frequency: %.2f Hz"
+_FMT_MOIST = "Moisture: %.1f%%"
+_FMT_ICON = "Displaying: %s drop icon"
+_FMT_SLEEP = "Sleeping for %d seconds...\n"
+
+# Parsed JSON files keyed by path (MicroPython has no functools.lru_cache)
+_CFG_CACHE = {}
+
+def _read_json(path):
+    """Load a JSON file, reusing the parsed result on later calls"""
+    if path not in _CFG_CACHE:
+        with open(path, 'r') as f:
+            _CFG_CACHE[path] = json.load(f)
+    return _CFG_CACHE[path]
+
+@rp2.asm_pio()
+def pulse_counter():
+    """PIO program: decrement X on every rising edge of the input pin"""
+    label("loop")
+    wait(0, pin, 0)
+    wait(1, pin, 0)
+    jmp(x_dec, "loop")
+
 class WiFiManager:
     """Handles WiFi connection and NTP time sync"""
     
@@ -58,15 +87,14 @@ class WiFiManager:
     def load_credentials(self):
         """Load WiFi credentials from JSON file"""
         try:
-            with open(WIFI_CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config['ssid'], config['password']
+            config = _read_json(WIFI_CONFIG_FILE)
+            return config['ssid'], config['password']
         except Exception as e:
             print(f"Error loading WiFi config: {e}")
             return None, None
     
-    def connect(self, timeout=10):
-        """Connect to WiFi network"""
+    def connect(self, timeout=10, progress=None):
+        """Connect to WiFi network, calling progress(step) while waiting"""
         ssid, password = self.load_credentials()
         
         if not ssid or not password:
@@ -78,16 +106,25 @@ class WiFiManager:
         self.wlan.active(True)
         self.wlan.connect(ssid, password)
         
-        # Wait for connection
-        start_time = time.time()
+        # Wait for connection, polling with exponential backoff (10 ms -> 250 ms)
+        start_time = time.ticks_ms()
+        last_tick = start_time
+        poll_ms = 10
+        step = 0
         while not self.wlan.isconnected():
-            if time.time() - start_time > timeout:
+            now = time.ticks_ms()
+            if time.ticks_diff(now, start_time) > timeout * 1000:
                 print("WiFi connection timeout!")
                 return False
-            time.sleep(0.5)
-            print(".", end="")
+            # Rate-limit the ticker so fast polls don't each block on I2C
+            if progress and time.ticks_diff(now, last_tick) >= PROGRESS_INTERVAL_MS:
+                last_tick = now
+                progress(step)
+                step += 1
+            time.sleep_ms(poll_ms)
+            poll_ms = min(poll_ms * 2, 250)
         
-        print("\n✓ WiFi connected!")
+        print("✓ WiFi connected!")
         print(f"IP address: {self.wlan.ifconfig()[0]}")
         self.connected = True
         return True
@@ -141,36 +178,45 @@ class MoistureSensor:
     
     def __init__(self, pin_number):
         self.pin = machine.Pin(pin_number, machine.Pin.IN, machine.Pin.PULL_DOWN)
-        self.pulse_count = 0
+        # Edges are counted by a PIO state machine, not a Python interrupt
+        self.sm = rp2.StateMachine(0, pulse_counter, in_base=self.pin)
+        self.gate = machine.Timer()
         self.last_frequency = 0
-        
-    def count_pulse(self, pin):
-        """Interrupt handler for counting pulses"""
-        self.pulse_count += 1
+    
+    def close_gate(self, timer):
+        """Timer callback: stop counting at the end of the sample window"""
+        self.sm.active(0)
     
     def read_frequency(self, sample_time=2):
         """
         Measure the pulse frequency from the sensor
         Returns frequency in Hz
         """
-        self.pulse_count = 0
+        # Restart the program and preload X with 0xFFFFFFFF
+        self.sm.init(pulse_counter, in_base=self.pin)
+        self.sm.exec("mov(x, invert(null))")
         
-        # Set up interrupt on rising edge
-        self.pin.irq(trigger=machine.Pin.IRQ_RISING, handler=self.count_pulse)
+        # Count pulses for sample_time seconds, gated by a one-shot timer.
+        # The CPU idles (WFE) meanwhile; lightsleep() is not used because it
+        # gates the system clock that drives the PIO block.
+        self.sm.active(1)
+        self.gate.init(mode=machine.Timer.ONE_SHOT, period=int(sample_time * 1000),
+                       callback=self.close_gate, hard=False)
+        while self.sm.active():
+            machine.idle()
         
-        # Count pulses for sample_time seconds
-        time.sleep(sample_time)
-        
-        # Disable interrupt
-        self.pin.irq(handler=None)
+        # Read X back through the RX FIFO
+        self.sm.exec("mov(isr, x)")
+        self.sm.exec("push()")
+        pulse_count = 0xFFFFFFFF - self.sm.get()
         
         # Calculate frequency
-        frequency = self.pulse_count / sample_time
+        frequency = pulse_count / sample_time
         self.last_frequency = frequency
         
         return frequency
     
-    def read_moisture_percent(self, dry_freq, wet_freq):
+    def read_moisture_percent(self, config):
         """
         Convert frequency to moisture percentage
         IMPORTANT: INVERSE relationship for capacitive sensors
@@ -180,15 +226,16 @@ class MoistureSensor:
         freq = self.read_frequency(FREQUENCY_SAMPLE_TIME)
         
         # Clamp frequency to calibration range (note: dry_freq > wet_freq)
-        freq = max(min(freq, dry_freq), wet_freq)
-        
-        # Convert to percentage (0% = dry, 100% = wet)
-        if dry_freq == wet_freq:
-            return 0
+        dry = config.dry_freq
+        if freq > dry:
+            freq = dry
+        elif freq < config.wet_freq:
+            freq = config.wet_freq
         
         # INVERSE: higher freq = drier, so (dry_freq - freq) gives moisture
-        moisture_percent = ((dry_freq - freq) / (dry_freq - wet_freq)) * 100
-        return max(0, min(100, moisture_percent))  # Clamp to 0-100%
+        # (0% = dry, 100% = wet; inv_range is 0 if dry_freq == wet_freq).
+        # With freq clamped to [wet, dry] the result is already 0-100%.
+        return (dry - freq) * config.inv_range
 
 class MoistureDisplay:
     """Handles OLED display with Phosphor icon graphics"""
@@ -197,49 +244,72 @@ class MoistureDisplay:
         self.oled = SSD1306_I2C(DISPLAY_WIDTH, DISPLAY_HEIGHT, i2c)
         self.oled.contrast(255)
         
-        # Create framebuffers for icons
+        # Create framebuffers for icons (views into one shared icon buffer)
         self.icon_empty = framebuf.FrameBuffer(DROP_EMPTY, 32, 32, framebuf.MONO_HLSB)
         self.icon_half = framebuf.FrameBuffer(DROP_HALF, 32, 32, framebuf.MONO_HLSB)
         self.icon_full = framebuf.FrameBuffer(DROP_FULL, 32, 32, framebuf.MONO_HLSB)
         
+        # Lookup table: whole percent (0-100) -> icon
+        self._icon_lut = tuple(
+            self.icon_empty if i < 34 else self.icon_half if i < 67 else self.icon_full
+            for i in range(101)
+        )
+        
+        # True while the framebuffer holds the moisture screen layout
+        self._moisture_layout = False
+        
+        # Copy of the last frame sent to the panel (driver init sends a blank one)
+        self._shown = bytearray(len(self.oled.buffer))
+        
+        # One-page (128x8) row buffer, sent with write_page() without a full redraw
+        self.row = bytearray(DISPLAY_WIDTH)
+        self.row_fb = framebuf.FrameBuffer(self.row, DISPLAY_WIDTH, 8, framebuf.MONO_VLSB)
+        
+    def _show(self):
+        """Send the framebuffer to the panel only if it has changed"""
+        if self.oled.buffer != self._shown:
+            self._shown[:] = self.oled.buffer
+            self.oled.show()
+    
     def clear(self):
         """Clear the display"""
         self.oled.fill(0)
-        self.oled.show()
+        self._show()
+        self._moisture_layout = False
     
     def get_icon_for_moisture(self, moisture_percent):
         """Select appropriate icon based on moisture level"""
-        if moisture_percent < 34:
-            return self.icon_empty  # 0-33%: Empty drop
-        elif moisture_percent < 67:
-            return self.icon_half   # 34-66%: Half drop
-        else:
-            return self.icon_full   # 67-100%: Full drop
+        # 0-33%: Empty drop, 34-66%: Half drop, 67-100%: Full drop
+        return self._icon_lut[int(moisture_percent)]
     
     def show_moisture(self, moisture_percent, frequency):
         """Display moisture reading with Phosphor icon"""
-        self.oled.fill(0)
+        # Draw the static label once; later readings only redraw what changes
+        if not self._moisture_layout:
+            self.oled.fill(0)
+            self.oled.text("Moisture", 40, 10, 1)
+            self._moisture_layout = True
         
-        # Select and display appropriate icon
+        # Select and display appropriate icon (blit overwrites the whole 32x32 area)
         icon = self.get_icon_for_moisture(moisture_percent)
         self.oled.blit(icon, 0, 16)  # Center vertically (64-32)/2 = 16
         
-        # Display text on right side
-        self.oled.text("Moisture", 40, 10, 1)
-        
         # Large percentage display
         percent_text = "{:.0f}%".format(moisture_percent)
+        self.oled.fill_rect(40, 28, 88, 8, 0)
         self.oled.text(percent_text, 50, 28, 1)
         
         # Show frequency (for debugging/info)
         freq_text = "{:.1f}Hz".format(frequency)
+        self.oled.fill_rect(40, 50, 88, 8, 0)
         self.oled.text(freq_text, 45, 50, 1)
         
-        self.oled.show()
+        self._show()
     
     def show_message(self, line1, line2="", line3="", line4=""):
         """Display a multi-line message"""
         self.oled.fill(0)
+        self._moisture_layout = False
         if line1:
             self.oled.text(line1, 0, 0, 1)
         if line2:
@@ -248,7 +318,26 @@ class MoistureDisplay:
             self.oled.text(line3, 0, 32, 1)
         if line4:
             self.oled.text(line4, 0, 48, 1)
-        self.oled.show()
+        self._show()
+    
+    def write_page(self, page, buf):
+        """Send one page (8-pixel row) straight to the panel"""
+        self.oled.write_cmd(0x21)  # SET_COL_ADDR
+        self.oled.write_cmd(0)
+        self.oled.write_cmd(DISPLAY_WIDTH - 1)
+        self.oled.write_cmd(0x22)  # SET_PAGE_ADDR
+        self.oled.write_cmd(page)
+        self.oled.write_cmd(page)
+        self.oled.write_data(buf)
+        # Keep the copy of the panel contents in step for _show()
+        self._shown[page * DISPLAY_WIDTH:(page + 1) * DISPLAY_WIDTH] = buf
+    
+    def show_progress(self, step, page=4):
+        """Show a 1-16 dot progress ticker on one page (default: third text line)"""
+        self.row_fb.fill(0)
+        for i in range(step % 16 + 1):
+            self.row_fb.fill_rect(i * 8 + 3, 3, 2, 2, 1)
+        self.write_page(page, self.row)
     
     def power_off(self):
         """Turn off display to save power"""
@@ -265,34 +354,52 @@ class Configuration:
         self.filename = filename
         self.dry_freq = 27.0  # Default: typical dry reading (HIGH frequency)
         self.wet_freq = 5.0   # Default: typical wet reading (LOW frequency)
+        self.inv_range = 0.0  # Precomputed 100 / (dry_freq - wet_freq)
         self.load()
     
     def load(self):
         """Load configuration from file"""
         try:
-            with open(self.filename, 'r') as f:
-                data = json.load(f)
+            with open(self.filename, 'rb') as f:
+                self.dry_freq, self.wet_freq = struct.unpack('<ff', f.read(8))
+            print(f"Loaded config: dry={self.dry_freq}Hz, wet={self.wet_freq}Hz")
+        except:
+            try:
+                # One-shot migration from the old JSON config file
+                with open(LEGACY_CONFIG_FILE, 'r') as f:
+                    data = json.load(f)
                 self.dry_freq = data.get('dry_freq', 27.0)
                 self.wet_freq = data.get('wet_freq', 5.0)
-                print(f"Loaded config: dry={self.dry_freq}Hz, wet={self.wet_freq}Hz")
-        except:
-            print("No config file found, using defaults")
-            self.save()  # Create default config file
+                print(f"Migrating {LEGACY_CONFIG_FILE} to {self.filename}")
+            except:
+                print("No config file found, using defaults")
+            self.save()  # Create binary config file
+        self.update_range()
+    
+    def update_range(self):
+        """Precompute the frequency-to-percent scale factor"""
+        if self.dry_freq != self.wet_freq:
+            self.inv_range = 100.0 / (self.dry_freq - self.wet_freq)
+        else:
+            self.inv_range = 0.0
     
     def save(self):
         """Save configuration to file"""
-        data = {
-            'dry_freq': self.dry_freq,
-            'wet_freq': self.wet_freq
-        }
-        with open(self.filename, 'w') as f:
-            json.dump(data, f)
+        with open(self.filename, 'wb') as f:
+            f.write(struct.pack('<ff', self.dry_freq, self.wet_freq))
         print(f"Saved config: dry={self.dry_freq}Hz, wet={self.wet_freq}Hz")
 
+# Last formatted timestamp: [epoch seconds, string]
+_LAST_T = [None, ""]
+
 def format_timestamp():
-    """Format current time as readable string"""
-    t = time.localtime()
-    return f"{t[0]}-{t[1]:02d}-{t[2]:02d} {t[3]:02d}:{t[4]:02d}:{t[5]:02d}"
+    """Format current time as readable string (cached per second)"""
+    n = time.time()
+    if n != _LAST_T[0]:
+        t = time.localtime(n)
+        _LAST_T[0] = n
+        _LAST_T[1] = "%d-%02d-%02d %02d:%02d:%02d" % (t[0], t[1], t[2], t[3], t[4], t[5])
+    return _LAST_T[1]
 
 def main():
     """Main program loop"""
@@ -316,7 +423,7 @@ def main():
     
     display.show_message("Connecting", "to WiFi...", "", "")
     
-    if wifi.connect(timeout=15):
+    if wifi.connect(timeout=15, progress=display.show_progress):
         display.show_message("WiFi OK", "Syncing time...", "", "")
         time.sleep(1)
         
@@ -359,12 +466,12 @@ def main():
         while True:
             # Take reading
             timestamp = format_timestamp()
-            print(f"[{timestamp}] Taking reading...")
-            moisture = sensor.read_moisture_percent(config.dry_freq, config.wet_freq)
+            print(_FMT_READING % timestamp)
+            moisture = sensor.read_moisture_percent(config)
             frequency = sensor.last_frequency
             
-            print(f"Frequency: {frequency:.2f} Hz")
-            print(f"Moisture: {moisture:.1f}%")
+            print(_FMT_FREQ % frequency)
+            print(_FMT_MOIST % moisture)
             
             # Determine which icon
             if moisture < 34:
@@ -373,7 +480,7 @@ def main():
                 icon_name = "HALF"
             else:
                 icon_name = "FULL"
-            print(f"Displaying: {icon_name} drop icon")
+            print(_FMT_ICON % icon_name)
             
             # Update display
             display.power_on()
@@ -384,7 +491,7 @@ def main():
             display.power_off()
             
             # Wait until next reading
-            print(f"Sleeping for {MEASUREMENT_INTERVAL} seconds...\n")
+            print(_FMT_SLEEP % MEASUREMENT_INTERVAL)
             time.sleep(MEASUREMENT_INTERVAL - 10)  # Account for 10s display time
             
     except KeyboardInterrupt:
@@ -5,6 +5,7 @@ Run this BEFORE running main.py
 """
 
 import machine
+import micropython
 import time
 
 print("\n" + "="*50)
@@ -50,17 +51,23 @@ try:
     sensor_pin = machine.Pin(26, machine.Pin.IN, machine.Pin.PULL_DOWN)
     print("✓ Sensor pin (GP26) configured")
     
-    # Count pulses for 2 seconds
-    pulse_count = 0
+    # Count rising edges by polling the SIO GPIO_IN register (no IRQs)
+    @micropython.viper
+    def count_edges(ms: int) -> int:
+        GPIO_IN = ptr32(0xd0000004)
+        mask = 1 << 26
+        start = time.ticks_ms()
+        prev = GPIO_IN[0] & mask
+        n = 0
+        while int(time.ticks_diff(time.ticks_ms(), start)) < ms:
+            cur = GPIO_IN[0] & mask
+            if cur != 0 and prev == 0:
+                n += 1
+            prev = cur
+        return n
     
-    def count_pulse(pin):
-        global pulse_count
-        pulse_count += 1
-    
-    sensor_pin.irq(trigger=machine.Pin.IRQ_RISING, handler=count_pulse)
     print("  Counting pulses for 2 seconds...")
-    time.sleep(2)
-    sensor_pin.irq(handler=None)
+    pulse_count = count_edges(2000)
     
     frequency = pulse_count / 2
     print(f"✓ Measured frequency: {frequency:.2f} Hz")